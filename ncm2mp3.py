@@ -1,18 +1,35 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import io
 import os
-import time
 import json
 import base64
+import functools
 import struct
 import binascii
 import warnings
-import mimetypes
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, Tuple
 
 import requests
-from Crypto.Cipher import AES
-import eyed3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from mutagen import MutagenError
+from mutagen.id3 import ID3, APIC, ID3NoHeaderError
+
+try:
+    import numpy as np
+except ImportError:  # numpy 可选，缺失时退回纯 Python 实现
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba 可选，缺失时使用 numpy 实现
+    njit = None
 
 
 # ------------------------------
@@ -27,41 +44,112 @@ SESSION.headers.update({
         "Chrome/100.0.4896.127 Safari/537.36"
     )
 })
+# 加大连接池并保持长连接，多个线程下载同一 CDN 的封面时复用 TLS 连接；
+# 连接错误与 502/503/504 由适配器按指数退避自动重试（共最多 3 次请求），
+# 这是唯一的重试层
+_ADAPTER = HTTPAdapter(
+    pool_connections=32, pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=2, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+# 封面下载在后台线程进行，与音频解密重叠。线程池按需创建：
+# main() 使用线程池转换时按并发数设定大小，否则（单独调用或进程池的子进程）使用默认大小
+_COVER_POOL = None
+_COVER_LOCK = threading.RLock()
+
+
+def _cover_pool(max_workers: int = 4) -> ThreadPoolExecutor:
+    """
+    返回封面下载线程池，首次调用时以 max_workers 创建；之后的调用忽略该参数。
+    """
+    global _COVER_POOL
+    with _COVER_LOCK:
+        if _COVER_POOL is None:
+            _COVER_POOL = ThreadPoolExecutor(max_workers=max_workers,
+                                             thread_name_prefix="cover")
+        return _COVER_POOL
 
 
-def download_pic(url: str, save_fn: str, timeout: float = 10.0,
-                 retries: int = 3, backoff: float = 2.0) -> str:
+def download_pic(url: str, timeout: float = 10.0) -> Tuple[str, bytes]:
     """
-    下载封面图片到 save_fn，并返回响应的 Content-Type（mime）。
-    采用流式下载 + 原子写，失败会按指数退避重试。
+    下载封面图片，返回 (响应的 Content-Type（mime）, 图片字节)。
+    封面通常只有几十 KiB，直接保存在内存中；重试由 SESSION 的适配器负责。
     """
-    last_exc = None
-    for attempt in range(1, retries + 1):
-        try:
-            with SESSION.get(url, timeout=timeout, stream=True) as r:
-                r.raise_for_status()
-                mime = r.headers.get("Content-Type", "").split(";")[0].strip().lower()
-                tmp = save_fn + ".part"
-                with open(tmp, "wb") as f:
-                    for chunk in r.iter_content(64 * 1024):
-                        if chunk:
-                            f.write(chunk)
-                os.replace(tmp, save_fn)
-                return mime
-        except Exception as exc:
-            last_exc = exc
-            if attempt < retries:
-                time.sleep(backoff ** attempt)
-            else:
-                raise RuntimeError(f"图片下载失败: {exc}") from exc
-    raise last_exc  # 理论不可达
+    try:
+        with SESSION.get(url, timeout=timeout) as r:
+            r.raise_for_status()
+            mime = r.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            return mime, r.content
+    except Exception as exc:
+        raise RuntimeError(f"图片下载失败: {exc}") from exc
+
+
+# 同一批次中同专辑的歌曲共用封面 URL：按 URL 共享下载的 Future，进行中的下载也会被复用。
+# 只保留最近 64 个 URL；失败的下载会从表中移除，下次重新请求
+_COVER_FUTURES = OrderedDict()  # url -> Future
+_COVER_CACHE_SIZE = 64
+
+
+def _fetch_cover(url: str) -> Future:
+    """
+    提交 url 的封面下载并返回其 Future；同一 URL 已在下载或已下载成功时直接复用。
+    返回的 Future 可能被多个调用方共享，调用方不应取消它。
+    """
+    with _COVER_LOCK:
+        fut = _COVER_FUTURES.get(url)
+        if fut is not None:
+            _COVER_FUTURES.move_to_end(url)
+            return fut
+        fut = _cover_pool().submit(download_pic, url)
+        _COVER_FUTURES[url] = fut
+        while len(_COVER_FUTURES) > _COVER_CACHE_SIZE:
+            _COVER_FUTURES.popitem(last=False)
+    fut.add_done_callback(lambda f: _forget_failed_cover(url, f))
+    return fut
+
+
+def _forget_failed_cover(url: str, fut: Future) -> None:
+    """
+    下载失败时把 Future 移出共享表，避免失败结果被后续文件复用。
+    """
+    if fut.cancelled() or fut.exception() is not None:
+        with _COVER_LOCK:
+            if _COVER_FUTURES.get(url) is fut:
+                del _COVER_FUTURES[url]
+
+
+# ------------------------------
+# AES-ECB 解密（OpenSSL EVP，可用 AES-NI）
+# ------------------------------
+
+# 两把密钥均为常量，Cipher 对象在模块级缓存；每次解密只新建 decryptor 上下文
+_CORE_CIPHER = Cipher(
+    algorithms.AES(binascii.a2b_hex("687A4852416D736F356B496E62617857")), modes.ECB()
+)
+_META_CIPHER = Cipher(
+    algorithms.AES(binascii.a2b_hex("2331346C6A6B5F215C5D2630553C2728")), modes.ECB()
+)
+
+
+def _aes_ecb_decrypt(cipher: Cipher, data: bytes) -> bytes:
+    decryptor = cipher.decryptor()
+    return decryptor.update(data) + decryptor.finalize()
+
+
+def _unpad(data: bytes) -> bytes:
+    """
+    去除 PKCS#7 填充。解密结果总是 bytes，末字节即填充长度。
+    """
+    return data[:-data[-1]]
 
 
 # ------------------------------
 # MP3 写封面
 # ------------------------------
 
-def add_cover_2_mp3(mp3_fp: str, pic_fp: str, mime_type: str) -> None:
+def add_cover_2_mp3(mp3_fp: str, pic_data: bytes, mime_type: str) -> None:
     """
     给 MP3 写入 APIC 封面。只处理 MP3；PNG/JPEG通常兼容，WEBP 常见兼容性差会跳过。
     """
@@ -72,31 +160,167 @@ def add_cover_2_mp3(mp3_fp: str, pic_fp: str, mime_type: str) -> None:
         warnings.warn(f"封面格式不受支持，跳过：{mime_type}")
         return
 
-    audio = eyed3.load(mp3_fp)
-    if audio is None:
-        warnings.warn(f"无法加载 MP3：{mp3_fp}")
-        return
-    if audio.tag is None:
-        audio.initTag()
+    # 只读写 ID3 标签，不解析音频帧
+    try:
+        tag = ID3(mp3_fp)
+    except ID3NoHeaderError:
+        tag = ID3()
 
-    with open(pic_fp, "rb") as fh:
-        audio.tag.images.set(3, fh.read(), mime_type)
-    audio.tag.save()
+    tag.add(APIC(encoding=3, mime=mime_type, type=3, desc="Cover", data=pic_data))
+    tag.save(mp3_fp)
+
+
+# ------------------------------
+# 音频 XOR 内核
+# ------------------------------
+
+def _build_key_box(key_data: bytes) -> bytes:
+    """
+    由解密后的 key 数据初始化 256 字节的 key_box（RC4-like KSA）。
+    """
+    key_box = bytearray(range(256))
+    c = 0
+    last = 0
+    off = 0
+    for i in range(256):
+        swap = key_box[i]
+        c = (swap + last + key_data[off]) & 0xFF
+        off = (off + 1) % len(key_data)
+        key_box[i], key_box[c] = key_box[c], key_box[i]
+        last = c
+    return bytes(key_box)
+
+
+def _build_keystream(key_box: bytes) -> bytes:
+    """
+    由 key_box 预计算 256 字节的音频密钥流周期。
+    密钥流只与 j = i & 0xFF 有关；第 p 个字节（从 0 起）对应 i = p + 1，
+    故 ks[k] 取 j = (k + 1) & 0xFF，使 ks 可直接按数据下标平铺。
+    """
+    ks = bytearray(256)
+    for k in range(256):
+        j = (k + 1) & 0xFF
+        ks[k] = key_box[(key_box[j] + key_box[(key_box[j] + j) & 0xFF]) & 0xFF]
+    return bytes(ks)
+
+
+def _xor_byte(data: bytes, value: int) -> bytes:
+    """
+    将 data 每个字节与同一个常量 value 异或，返回结果。
+    """
+    if np is not None:
+        arr = np.frombuffer(data, dtype=np.uint8).copy()
+        arr ^= np.uint8(value)
+        return arr.tobytes()
+    return data.translate(bytes(i ^ value for i in range(256)))
+
+
+def _tile_keystream_int(ks: bytes, n: int) -> int:
+    """
+    将 ks 平铺到 n 字节并转为大整数。
+    """
+    return int.from_bytes((ks * (n // 256 + 1))[:n], "little")
+
+
+# 整块长度固定为 _CHUNK_SIZE，按 (ks, n) 缓存平铺后的大整数，每个文件只转换一次
+_tile_keystream_int_cached = functools.lru_cache(maxsize=8)(_tile_keystream_int)
+
+
+def _xor_fallback(buf, ks: bytes) -> None:
+    """
+    无 numpy 时的纯 Python 实现：按 _CHUNK_SIZE 切片，把每片与平铺后的密钥流
+    各视为一个大整数，一次异或在 C 层按机器字完成，再写回该片。
+    整片复用缓存的密钥流整数，只有末尾不足一片的部分需要现算。
+    """
+    with memoryview(buf) as mv:
+        for off in range(0, len(mv), _CHUNK_SIZE):
+            part = mv[off:off + _CHUNK_SIZE]
+            n = len(part)
+            if n == _CHUNK_SIZE:
+                tile = _tile_keystream_int_cached(ks, n)
+            else:
+                tile = _tile_keystream_int(ks, n)
+            x = int.from_bytes(part, "little") ^ tile
+            part[:] = x.to_bytes(n, "little")
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _xor_keystream_nb(buf, ks):
+        """
+        numba 编译的原生循环，原地异或且不持有 GIL。
+        按 256 字节一行处理，内层定长循环无取模、可被 LLVM 向量化；末尾不足一行的部分单独处理。
+        """
+        n = buf.size
+        body = n & ~0xFF
+        for base in range(0, body, 256):
+            for k in range(256):
+                buf[base + k] ^= ks[k]
+        for k in range(n - body):
+            buf[body + k] ^= ks[k]
+
+
+def _xor_keystream(buf, ks: bytes) -> None:
+    """
+    将可写缓冲区 buf 与 256 字节周期的密钥流 ks 原地异或，buf 起点须对齐周期起点。
+    有 numba 时使用其逐行原生循环（实测快于 numpy 广播），其次 numpy 按行广播，
+    都没有时退回 _xor_fallback。
+    """
+    if np is None:
+        _xor_fallback(buf, ks)
+        return
+    if njit is not None:
+        _xor_keystream_nb(np.frombuffer(buf, dtype=np.uint8),
+                          np.frombuffer(ks, dtype=np.uint8))
+        return
+    # 按 256 字节一行广播异或，不生成与 buf 等长的平铺临时数组；末尾不足一行的部分单独处理
+    n = len(buf)
+    body = n & ~0xFF
+    ks_arr = np.frombuffer(ks, dtype=np.uint8)
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    rows = arr[:body].reshape(-1, 256)
+    rows ^= ks_arr
+    tail = arr[body:]
+    tail ^= ks_arr[:n - body]
 
 
 # ------------------------------
 # NCM 解密核心
 # ------------------------------
 
+# 音频分块大小（须为 256 的整数倍）与一次性解密的上限
+_CHUNK_SIZE = 1 << 20
+_ONESHOT_LIMIT = 256 << 20
+
+
+def _payload_has_cover(f, ks: bytes) -> bool:
+    """
+    解密音频数据开头的 ID3v2 标签（若有），判断其中是否已有 APIC 封面。
+    f 须位于音频数据起点，返回前恢复原位置；无标签或解析失败时返回 False。
+    """
+    pos = f.tell()
+    try:
+        head = bytearray(f.read(10))
+        _xor_keystream(head, ks)
+        if len(head) < 10 or head[:3] != b"ID3":
+            return False
+        # 标签长度为 4 字节 syncsafe 整数（每字节 7 位），不含 10 字节头
+        size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+        f.seek(pos)
+        tag = bytearray(f.read(10 + size))
+        _xor_keystream(tag, ks)
+        return bool(ID3(io.BytesIO(tag)).getall("APIC"))
+    except MutagenError:
+        return False
+    finally:
+        f.seek(pos)
+
+
 def dump_ncm(input_fp: str, output_fp: str) -> str:
     """
     解密 NCM 文件为音频（mp3 或 flac），并尝试写入封面（仅 MP3）。
     返回最终写入的音频文件完整路径。
     """
-    core_key = binascii.a2b_hex("687A4852416D736F356B496E62617857")
-    meta_key = binascii.a2b_hex("2331346C6A6B5F215C5D2630553C2728")
-    unpad = lambda s: s[:-(s[-1] if isinstance(s[-1], int) else ord(s[-1]))]
-
     with open(input_fp, "rb") as f:
         header = f.read(8)
         # 'CTENFDAM'
@@ -105,32 +329,18 @@ def dump_ncm(input_fp: str, output_fp: str) -> str:
 
         # 解密 key 数据
         key_length = struct.unpack("<I", f.read(4))[0]
-        key_data = bytearray(f.read(key_length))
-        for i in range(len(key_data)):
-            key_data[i] ^= 0x64
-
-        key_data = unpad(AES.new(core_key, AES.MODE_ECB).decrypt(bytes(key_data)))[17:]
-
-        # 初始化 key_box（RC4-like）
-        key_box = bytearray(range(256))
-        c = 0
-        last = 0
-        off = 0
-        for i in range(256):
-            swap = key_box[i]
-            c = (swap + last + key_data[off]) & 0xFF
-            off = (off + 1) % len(key_data)
-            key_box[i], key_box[c] = key_box[c], key_box[i]
-            last = c
+        key_data = _xor_byte(f.read(key_length), 0x64)
+        key_data = _unpad(_aes_ecb_decrypt(_CORE_CIPHER, key_data))[17:]
+
+        # 初始化 key_box（RC4-like），并只算一次 256 字节密钥流周期
+        ks = _build_keystream(_build_key_box(key_data))
 
         # 读取 meta 并解密
         meta_length = struct.unpack("<I", f.read(4))[0]
-        meta_data = bytearray(f.read(meta_length))
-        for i in range(len(meta_data)):
-            meta_data[i] ^= 0x63
-        meta_data = base64.b64decode(bytes(meta_data)[22:])
-        meta_raw = AES.new(meta_key, AES.MODE_ECB).decrypt(meta_data)
-        meta = json.loads(unpad(meta_raw).decode("utf-8")[6:])
+        meta_data = _xor_byte(f.read(meta_length), 0x63)
+        meta_data = base64.b64decode(meta_data[22:])
+        meta_raw = _aes_ecb_decrypt(_META_CIPHER, meta_data)
+        meta = json.loads(_unpad(meta_raw).decode("utf-8")[6:])
 
         # 跳过内置封面二进制（后续通过 URL 下载）
         f.read(4)  # 跳过 crc32
@@ -143,50 +353,54 @@ def dump_ncm(input_fp: str, output_fp: str) -> str:
         if not output_fp.lower().endswith("." + ext):
             output_fp = os.path.splitext(output_fp)[0] + "." + ext
 
-        # 解密音频数据
-        with open(output_fp, "wb") as m:
-            while True:
-                chunk = bytearray(f.read(0x8000))
-                if not chunk:
-                    break
-                n = len(chunk)
-                for i in range(1, n + 1):
-                    j = i & 0xFF
-                    idx = (key_box[j] + key_box[(key_box[j] + j) & 0xFF]) & 0xFF
-                    chunk[i - 1] ^= key_box[idx]
-                m.write(chunk)
-
-    # 下载封面并写入（最佳努力）
-    cover_url = (meta.get("albumPic") or "").strip()
-    if cover_url:
-        # 临时文件后缀仅用于保存；真正的 MIME 以响应头为准
-        tmp_ext = mimetypes.guess_extension(cover_url.split("?")[0]) or ".img"
-        tmp_file = os.path.join(
-            os.path.dirname(output_fp),
-            f".cover_{os.path.basename(output_fp)}{tmp_ext}"
-        )
+        # 封面 URL 在 meta 中已知：先在后台开始下载，与音频解密重叠。
+        # 只有 MP3 会写封面；音频自带的 ID3 标签里已有封面时也无需下载
+        cover_url = (meta.get("albumPic") or "").strip()
+        cover_future = None
+        if cover_url and ext == "mp3" and not _payload_has_cover(f, ks):
+            cover_future = _fetch_cover(cover_url)
+
+        # 解密音频数据，原地异或后写出。有 numpy 时常规大小一次读入预分配缓冲区、
+        # 整体异或后一次写出；超大文件，以及纯 Python 回退路径（大整数异或会产生
+        # 数倍于数据的临时对象），按 1 MiB 分块以限制内存，
+        # 块长为 256 的整数倍，保持密钥流对齐
+        data_off = f.tell()
+        size = os.fstat(f.fileno()).st_size - data_off
+        with open(output_fp, "wb", buffering=_CHUNK_SIZE) as m:
+            if np is not None and size <= _ONESHOT_LIMIT:
+                out = bytearray(size)
+                del out[f.readinto(out):]
+                _xor_keystream(out, ks)
+                m.write(out)
+            else:
+                # 复用同一块缓冲区，readinto 直接读入，循环内不再分配
+                buf = bytearray(_CHUNK_SIZE)
+                with memoryview(buf) as mv:
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
+                        _xor_keystream(mv[:n], ks)
+                        m.write(mv[:n])
+
+    # 等待封面下载完成并写入（最佳努力）
+    if not cover_url:
+        warnings.warn("未发现专辑封面 URL，跳过添加封面")
+    elif cover_future is not None:
         try:
-            mime = download_pic(cover_url, tmp_file)
-            add_cover_2_mp3(output_fp, tmp_file, mime)
+            mime, pic_data = cover_future.result()
+            add_cover_2_mp3(output_fp, pic_data, mime)
         except Exception as exc:
             warnings.warn(f"封面处理失败：{exc}")
-        finally:
-            try:
-                if os.path.exists(tmp_file):
-                    os.remove(tmp_file)
-            except OSError:
-                pass
-    else:
-        warnings.warn("未发现专辑封面 URL，跳过添加封面")
 
     return output_fp
 
 
 # ------------------------------
-# 单文件转换（供进程池调用）
+# 单文件转换（供线程池/进程池调用）
 # ------------------------------
 
-def _convert_one(ncm_path: str, out_dir: str, max_cpu_percent: int = 80) -> bool:
+def _convert_one(ncm_path: str, out_dir: str) -> bool:
     """
     转换单个 .ncm 文件。成功返回 True。
     """
@@ -196,14 +410,6 @@ def _convert_one(ncm_path: str, out_dir: str, max_cpu_percent: int = 80) -> bool
 
     out_fp = os.path.join(out_dir, os.path.splitext(base)[0] + ".mp3")
 
-    # 简单 CPU 限流（可选）。若 psutil 不可用则直接继续。
-    try:
-        import psutil
-        while psutil.cpu_percent(interval=0.5) > max_cpu_percent:
-            time.sleep(0.5)
-    except Exception:
-        pass
-
     try:
         dump_ncm(ncm_path, out_fp)
         return True
@@ -212,13 +418,40 @@ def _convert_one(ncm_path: str, out_dir: str, max_cpu_percent: int = 80) -> bool
         return False
 
 
+def _convert_one_star(job: Tuple[str, str]) -> bool:
+    """
+    供 Executor.map 调用：解包 (ncm_path, out_dir)。
+    """
+    return _convert_one(*job)
+
+
 # ------------------------------
 # 批量入口
 # ------------------------------
 
+def _iter_ncm(root_dir: str) -> Iterator[Tuple[str, str]]:
+    """
+    基于 os.scandir 递归遍历 root_dir，产出 (所在目录, 文件名)，仅限 .ncm 文件。
+    目录项类型直接取自 DirEntry，无需逐个 stat；不跟随符号链接目录。
+    """
+    stack = [root_dir]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(".ncm"):
+                    yield dirpath, entry.name
+
+
 def main() -> None:
     import argparse
-    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures import ProcessPoolExecutor
     from tqdm import tqdm
 
     # 默认搜索路径
@@ -232,10 +465,11 @@ def main() -> None:
         help=f"包含 .ncm 文件的目录 (默认: {default_path})"
     )
     parser.add_argument(
-        "--workers", type=int, default=0, help="进程数（默认=80% CPU 核心数）"
+        "--workers", type=int, default=0, help="并发数（默认按 --max-cpu 换算）"
     )
     parser.add_argument(
-        "--max-cpu", type=int, default=80, help="最大 CPU 占用阈值（%）"
+        "--max-cpu", type=int, default=80,
+        help="目标 CPU 占用（%%），通过并发数限制实现（默认 80）"
     )
     args = parser.parse_args()
 
@@ -247,47 +481,49 @@ def main() -> None:
 
     # 递归收集未转换的文件
     files = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        for fname in filenames:
-            if not fname.lower().endswith(".ncm"):
-                continue
-            rel_path = os.path.relpath(dirpath, root_dir)   # 相对路径
-            base = os.path.splitext(fname)[0]
-
-            # 输出目录与输入保持相对结构
-            out_dir = os.path.join(output_root, rel_path)
+    existing = {}  # 输出目录 -> 其中已有的文件名集合，每个目录只列一次
+    for dirpath, fname in _iter_ncm(root_dir):
+        rel_path = os.path.relpath(dirpath, root_dir)   # 相对路径
+        base = os.path.splitext(fname)[0]
+
+        # 输出目录与输入保持相对结构
+        out_dir = os.path.join(output_root, rel_path)
+        done = existing.get(out_dir)
+        if done is None:
             os.makedirs(out_dir, exist_ok=True)
+            done = existing[out_dir] = set(os.listdir(out_dir))
 
-            out_mp3 = os.path.join(out_dir, base + ".mp3")
-            out_flac = os.path.join(out_dir, base + ".flac")
-
-            # 已经转换过就跳过
-            if os.path.exists(out_mp3) or os.path.exists(out_flac):
-                continue
+        # 已经转换过就跳过
+        if base + ".mp3" in done or base + ".flac" in done:
+            continue
 
-            files.append((os.path.join(dirpath, fname), out_dir))
+        files.append((os.path.join(dirpath, fname), out_dir))
 
     if not files:
         print("未找到需要转换的 .ncm 文件（可能都已转换过）")
         return
 
     cpu_count = os.cpu_count() or 1
-    max_workers = args.workers if args.workers > 0 else max(1, int(cpu_count * 0.8))
+    # CPU 占用由并发数统一控制，工作线程/进程内不再轮询采样
+    max_workers = (args.workers if args.workers > 0
+                   else max(1, int(cpu_count * args.max_cpu / 100)))
+
+    # numpy / numba 内核会释放 GIL，用线程池即可并行且省去进程启动开销；
+    # 纯 Python 回退路径受 GIL 限制，仍使用进程池
+    pool_cls = ThreadPoolExecutor if np is not None else ProcessPoolExecutor
+    if pool_cls is ThreadPoolExecutor:
+        # 每个转换线程都会等待自己的封面，封面线程数须与之匹配，否则封面排队拖慢整批
+        _cover_pool(max_workers)
+
+    # 按批提交任务，减少大批量时的调度与进程间通信开销（线程池会忽略 chunksize）
+    chunksize = max(1, len(files) // (max_workers * 4))
 
     ok = 0
-    with ProcessPoolExecutor(max_workers=max_workers) as ex:
-        futures = [
-            ex.submit(_convert_one, ncm_path, out_dir, args.max_cpu)
-            for ncm_path, out_dir in files
-        ]
-        with tqdm(total=len(futures), desc="Converting") as pbar:
-            for fut in as_completed(futures):
-                try:
-                    if fut.result():
-                        ok += 1
-                except Exception:
-                    pass
-                pbar.update(1)
+    with pool_cls(max_workers=max_workers) as ex:
+        results = ex.map(_convert_one_star, files, chunksize=chunksize)
+        for ok_flag in tqdm(results, total=len(files), desc="Converting"):
+            if ok_flag:
+                ok += 1
 
     print(f"完成：{ok}/{len(files)} 成功。输出目录：{output_root}")
 